@@ -1,7 +1,14 @@
 from setup import *
 from unsloth.kernels.utils import fast_dequantize
+# Reuse one output buffer per module so repeated calls skip the cudaMalloc.
+# Keyed on the module too, since up_proj and gate_proj share a shape.
+_OUT_CACHE = {}
 def unsloth_dequantize(weight):
-    return fast_dequantize(weight.weight, weight.weight.quant_state)
+    quant_state = weight.weight.quant_state
+    key = (id(weight), tuple(quant_state.shape), quant_state.dtype)
+    if key not in _OUT_CACHE:
+        _OUT_CACHE[key] = torch.empty(quant_state.shape, dtype = quant_state.dtype, device = "cuda")
+    return fast_dequantize(weight.weight, quant_state, out = _OUT_CACHE[key])
 print(test_dequantize(unsloth_dequantize))
 from peft.utils.integrations import dequantize_module_weight as peft_dequantize
 print(test_dequantize(peft_dequantize))